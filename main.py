@@ -7,7 +7,7 @@ from aiohttp import web
 from telegram.ext import Application, CommandHandler, MessageHandler, filters
 from telegram.request import HTTPXRequest
 from telegram.error import TelegramError
-from scanner import scanner_loop
+from scanner import scanner_loop, memory_report
 
 logging.basicConfig(
     level=logging.INFO,
@@ -43,6 +43,9 @@ async def cmd_start(update, ctx):
 async def cmd_ping(update, ctx):
     await update.message.reply_text("pong")
 
+async def cmd_mem(update, ctx):
+    await update.message.reply_text(memory_report())
+
 async def any_text(update, ctx):
     await update.message.reply_text("✅ got it")
 
@@ -51,6 +54,7 @@ def build_app() -> Application:
     app = Application.builder().token(TOKEN).request(req).build()
     app.add_handler(CommandHandler("start", cmd_start))
     app.add_handler(CommandHandler("ping", cmd_ping))
+    app.add_handler(CommandHandler("mem", cmd_mem))
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, any_text))
     app.add_handler(MessageHandler(filters.ALL, lambda *_: None))
     return app
@@ -58,9 +62,11 @@ def build_app() -> Application:
 # -------------------- Health server (для Render) --------------------
 async def start_health_server():
     async def ok(_): return web.Response(text="ok")
+    async def mem(_): return web.Response(text=memory_report())
     app = web.Application()
     app.router.add_get("/", ok)
     app.router.add_get("/healthz", ok)
+    app.router.add_get("/mem", mem)
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", PORT)
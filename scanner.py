@@ -8,7 +8,9 @@ import os
 import time
 import asyncio
 import logging
-from typing import List, Tuple, Optional, Dict
+import sys
+from array import array
+from typing import List, Tuple, Optional, Dict, Iterable, Sequence
 
 import aiohttp
 from telegram.constants import ParseMode
@@ -28,6 +30,7 @@ COOLDOWN_SEC       = int(os.getenv("COOLDOWN_SEC", "900"))           # анти
 STARTUP_PING       = os.getenv("STARTUP_PING", "true").lower() == "true"
 
 MIN_COIN_AGE_DAYS  = int(os.getenv("MIN_COIN_AGE_DAYS", "30"))       # не младше N дней
+AGE_RECHECK_SEC    = int(os.getenv("AGE_RECHECK_SEC", "21600"))      # перепроверка «молодых» монет
 BTC_FILTER         = os.getenv("BTC_FILTER", "off").lower()          # 'on'/'off'
 DISABLE_CHARTS     = os.getenv("DISABLE_CHARTS", "false").lower() == "true"
 
@@ -62,10 +65,100 @@ _symbols_cache: List[str] = []
 _last_reload: float = 0.0
 _symbols_backoff_until: float = 0.0  # когда можно снова пытаться обновлять список пар
 
-_last_sent: Dict[str, float] = {}    # антиспам по символу
-_last_sent_lock = asyncio.Lock()
 _sent_startup_ping = False
 
+AGE_UNKNOWN, AGE_YOUNG, AGE_OK = 0, 1, 2
+
+class SymbolRegistry:
+    """
+    Компактное состояние по символам: symbol -> int id, поля в array.
+    Делистнутые символы вытесняются в sync(), их id переиспользуются,
+    так что память ограничена размером текущего универса.
+    """
+    __slots__ = ("_ids", "_names", "_free", "last_sent", "age_state",
+                 "age_checked", "lock")
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._names: List[Optional[str]] = []
+        self._free: List[int] = []
+        self.last_sent   = array("d")   # антиспам: время последнего сигнала
+        self.age_state   = array("B")   # AGE_UNKNOWN / AGE_YOUNG / AGE_OK
+        self.age_checked = array("d")   # когда последний раз проверяли возраст
+        self.lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def id_of(self, symbol: str) -> int:
+        sid = self._ids.get(symbol)
+        if sid is not None:
+            return sid
+        if self._free:
+            sid = self._free.pop()
+            self._names[sid] = symbol
+            self._reset(sid)
+        else:
+            sid = len(self._names)
+            self._names.append(symbol)
+            self.last_sent.append(0.0)
+            self.age_state.append(AGE_UNKNOWN)
+            self.age_checked.append(0.0)
+        self._ids[symbol] = sid
+        return sid
+
+    def _reset(self, sid: int) -> None:
+        self.last_sent[sid] = 0.0
+        self.age_state[sid] = AGE_UNKNOWN
+        self.age_checked[sid] = 0.0
+
+    def sync(self, symbols: Iterable[str]) -> int:
+        """Приводит реестр к текущему универсу. Возвращает число вытесненных."""
+        keep = set(symbols)
+        gone = [sym for sym in self._ids if sym not in keep]
+        for sym in gone:
+            sid = self._ids.pop(sym)
+            self._names[sid] = None
+            self._reset(sid)
+            self._free.append(sid)
+        for sym in keep:
+            self.id_of(sym)
+        return len(gone)
+
+    def memory_report(self) -> Dict[str, int]:
+        arrays = (self.last_sent, self.age_state, self.age_checked)
+        return {
+            "symbols": len(self._ids),
+            "slots": len(self._names),
+            "free_slots": len(self._free),
+            "arrays_bytes": sum(a.itemsize * len(a) for a in arrays),
+            "index_bytes": sys.getsizeof(self._ids) + sys.getsizeof(self._names),
+        }
+
+REGISTRY = SymbolRegistry()
+
+def _rss_kb() -> Optional[int]:
+    """Текущий RSS процесса (Linux /proc), иначе None."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except Exception:
+        pass
+    return None
+
+def memory_report() -> str:
+    r = REGISTRY.memory_report()
+    rss = _rss_kb()
+    lines = [
+        f"🧠 RSS: {rss / 1024:.1f} MB" if rss is not None else "🧠 RSS: n/a",
+        f"📚 Символы: {r['symbols']} (слотов {r['slots']}, свободно {r['free_slots']})",
+        f"🧮 Состояние: {r['arrays_bytes']} B массивы + {r['index_bytes']} B индекс",
+        f"🗂 Кэш пар: {len(_symbols_cache)}",
+    ]
+    return "\n".join(lines)
+
 # ===================== Telegram helpers (retries) =====================
 async def tg_call(bot, method: str, *args, **kwargs):
     for attempt in range(1, TG_MAX_ATTEMPTS + 1):
@@ -168,7 +261,7 @@ async def fetch_klines(session: aiohttp.ClientSession, symbol: str, interval: st
     )
 
 # ===================== Indicators =====================
-def calc_rsi(closes: List[float], period: int = 14) -> Optional[float]:
+def calc_rsi(closes: Sequence[float], period: int = 14) -> Optional[float]:
     if len(closes) < period + 1:
         return None
     gains = losses = 0.0
@@ -207,16 +300,32 @@ async def btc_ok(session: aiohttp.ClientSession) -> bool:
         log.warning("btc_ok failed (ignore): %s", e)
         return True
 
-async def coin_age_ok(session: aiohttp.ClientSession, symbol: str) -> bool:
-    """Монете не меньше MIN_COIN_AGE_DAYS (по 1d свечам на споте)."""
+async def coin_age_ok(session: aiohttp.ClientSession, symbol: str, sid: int) -> bool:
+    """
+    Монете не меньше MIN_COIN_AGE_DAYS (по 1d свечам на споте).
+    Результат кэшируется в REGISTRY: «старые» монеты больше не проверяем,
+    «молодые» — не чаще раза в AGE_RECHECK_SEC.
+    """
     if MIN_COIN_AGE_DAYS <= 0:
         return True
+    state = REGISTRY.age_state[sid]
+    if state == AGE_OK:
+        return True
+    now = time.time()
+    if state == AGE_YOUNG and now - REGISTRY.age_checked[sid] < AGE_RECHECK_SEC:
+        return False
     try:
         d = await fetch_klines(session, symbol, "1d", min(1000, MIN_COIN_AGE_DAYS + 5))
-        return len(d) >= MIN_COIN_AGE_DAYS
     except Exception as e:
         log.warning("coin_age_ok %s failed (ignore): %s", symbol, e)
         return True
+    if not isinstance(d, list):
+        log.warning("coin_age_ok %s: unexpected response (ignore): %r", symbol, d)
+        return True
+    ok = len(d) >= MIN_COIN_AGE_DAYS
+    REGISTRY.age_state[sid] = AGE_OK if ok else AGE_YOUNG
+    REGISTRY.age_checked[sid] = now
+    return ok
 
 # ===================== Core loop =====================
 async def scanner_loop(bot, chat_id: int):
@@ -234,6 +343,10 @@ async def scanner_loop(bot, chat_id: int):
     while True:
         try:
             symbols, refreshed = await fetch_symbols()
+            if refreshed:
+                evicted = REGISTRY.sync(symbols)
+                if evicted:
+                    log.info("registry: evicted %d delisted symbols", evicted)
             if refreshed and symbols:
                 await tg_send_message(bot, chat_id=chat_id,
                                       text=f"🔄 Пары MEXC обновлены: {len(symbols)} (QUOTE={QUOTE})")
@@ -250,14 +363,15 @@ async def scanner_loop(bot, chat_id: int):
                 async def handle(sym: str):
                     async with sem:
                         try:
-                            if not await coin_age_ok(s, sym):
+                            sid = REGISTRY.id_of(sym)
+                            if not await coin_age_ok(s, sym, sid):
                                 return
 
                             data = await fetch_klines(s, sym, "1m", 40)
                             if not isinstance(data, list) or len(data) < 20:
                                 return
 
-                            closes = [float(x[4]) for x in data]
+                            closes = array("d", (float(x[4]) for x in data))
                             prev_c, last_c = closes[-2], closes[-1]
                             if prev_c <= 0:
                                 return
@@ -270,11 +384,10 @@ async def scanner_loop(bot, chat_id: int):
                             if change >= PUMP_THRESHOLD and rsi >= RSI_MIN:
                                 # антиспам
                                 now = time.time()
-                                async with _last_sent_lock:
-                                    last = _last_sent.get(sym, 0.0)
-                                    if now - last < COOLDOWN_SEC:
+                                async with REGISTRY.lock:
+                                    if now - REGISTRY.last_sent[sid] < COOLDOWN_SEC:
                                         return
-                                    _last_sent[sym] = now
+                                    REGISTRY.last_sent[sid] = now
 
                                 pct = round(change * 100, 2)
                                 mexc_url = f"https://www.mexc.com/exchange/{sym.replace(QUOTE,'')}_{QUOTE}"
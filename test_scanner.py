@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+import scanner
+from scanner import SymbolRegistry, AGE_UNKNOWN, AGE_YOUNG, AGE_OK
+
+
+# ===================== SymbolRegistry.sync =====================
+def test_sync_evicts_delisted_and_reuses_ids():
+    r = SymbolRegistry()
+    assert r.sync(["A", "B", "C"]) == 0
+    ids = {sym: r.id_of(sym) for sym in ("A", "B", "C")}
+
+    assert r.sync(["B", "D"]) == 2
+    assert len(r) == 2
+    assert r.id_of("B") == ids["B"]
+    assert r.id_of("D") in (ids["A"], ids["C"])
+    assert r.memory_report()["slots"] == 3
+    assert r.memory_report()["free_slots"] == 1
+
+
+def test_sync_resets_state_of_reused_slot():
+    r = SymbolRegistry()
+    r.sync(["A"])
+    sid = r.id_of("A")
+    r.last_sent[sid] = 123.0
+    r.age_state[sid] = AGE_YOUNG
+    r.age_checked[sid] = 456.0
+
+    r.sync(["D"])
+    assert r.id_of("D") == sid
+    assert r.last_sent[sid] == 0.0
+    assert r.age_state[sid] == AGE_UNKNOWN
+    assert r.age_checked[sid] == 0.0
+
+
+# ===================== coin_age_ok cache =====================
+@pytest.fixture
+def age_env(monkeypatch):
+    reg = SymbolRegistry()
+    calls = []
+    state = {"now": 1000.0, "klines": []}
+
+    async def fake_fetch_klines(session, symbol, interval, limit):
+        calls.append(symbol)
+        return state["klines"]
+
+    monkeypatch.setattr(scanner, "REGISTRY", reg)
+    monkeypatch.setattr(scanner, "MIN_COIN_AGE_DAYS", 30)
+    monkeypatch.setattr(scanner, "AGE_RECHECK_SEC", 3600)
+    monkeypatch.setattr(scanner, "fetch_klines", fake_fetch_klines)
+    monkeypatch.setattr(scanner.time, "time", lambda: state["now"])
+    return reg, calls, state
+
+
+def _age_ok(reg, sym):
+    return asyncio.run(scanner.coin_age_ok(None, sym, reg.id_of(sym)))
+
+
+def test_age_ok_is_never_refetched(age_env):
+    reg, calls, state = age_env
+    state["klines"] = [[0]] * 30
+
+    assert _age_ok(reg, "OLD") is True
+    assert reg.age_state[reg.id_of("OLD")] == AGE_OK
+    state["now"] += 10 ** 6
+    assert _age_ok(reg, "OLD") is True
+    assert calls == ["OLD"]
+
+
+def test_age_young_refetched_only_after_recheck(age_env):
+    reg, calls, state = age_env
+    state["klines"] = [[0]] * 5
+
+    assert _age_ok(reg, "NEW") is False
+    assert reg.age_state[reg.id_of("NEW")] == AGE_YOUNG
+    state["now"] += 3599
+    assert _age_ok(reg, "NEW") is False
+    assert calls == ["NEW"]
+
+    state["now"] += 1
+    state["klines"] = [[0]] * 30
+    assert _age_ok(reg, "NEW") is True
+    assert reg.age_state[reg.id_of("NEW")] == AGE_OK
+    assert calls == ["NEW", "NEW"]
+
+
+def test_age_error_body_is_not_cached(age_env):
+    reg, calls, state = age_env
+    state["klines"] = {"code": -1121, "msg": "Invalid symbol."}
+
+    assert _age_ok(reg, "ERR") is True
+    sid = reg.id_of("ERR")
+    assert reg.age_state[sid] == AGE_UNKNOWN
+    assert reg.age_checked[sid] == 0.0